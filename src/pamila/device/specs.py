@@ -53,6 +53,9 @@ class FunctionSpec(BaseModel):
     def deserialize_numpy_arrays_in_dict(cls, value):
         return {k: json_deserialize_numpy_array(v) for k, v in value.items()}
 
+    # Instances are shared among the unit conversion specs built by the loader.
+    model_config = {"frozen": True}
+
 
 def _reconstruct_callable(func_spec: FunctionSpec) -> Callable:
     func_name = func_spec.name
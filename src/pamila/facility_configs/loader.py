@@ -1,11 +1,21 @@
-from copy import deepcopy
+from collections import OrderedDict
+import copy
+from functools import cache, partial
+import hashlib
 import json
+import os
 from pathlib import Path
-import re
+import sys
+import threading
 from typing import Dict, List, Literal
 
 from ophyd import Component as Cpt
-import yaml
+import platformdirs
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 from .. import MachineMode, get_machine_mode
 from ..device.conversion.plugin_manager import load_plugins
@@ -41,7 +51,7 @@ from ..sim_interface import (
     get_sim_pvprefix,
     set_sim_interface_spec,
 )
-from ..utils import KeyValueTagList
+from ..utils import KeyValueTagList, yaml_loads
 from .generator import StandardSetpointDeviceDefinition
 
 ExternalPamilaSignals = {
@@ -58,20 +68,254 @@ if False:
         "SignalRO": ExternalPamilaTangoSignalRO,
     }
 
+InternalPamilaSignals = {
+    "Signal": InternalPamilaSignal,
+    "SignalRO": InternalPamilaSignalRO,
+}
+
+_PDEV_PSIG_PREFIXES = {
+    # external pamila device & signal (LIVE)
+    MachineMode.LIVE: ("epdL", "epsL"),
+    # external pamila device & signal (DT)
+    MachineMode.DIGITAL_TWIN: ("epdD", "epsD"),
+    # internal pamila device & signal
+    MachineMode.SIMULATOR: ("ipd", "ips"),
+}
+
+_EXT_OR_INT = {
+    MachineMode.LIVE: "ext",
+    MachineMode.DIGITAL_TWIN: "ext",
+    MachineMode.SIMULATOR: "int",
+    MachineMode.SIMULATOR_1: "int",
+}
+
+_IDENTITY_FUNC_SPEC = FunctionSpec(name="identity")  # identity unit conversion
+
+
+# Parsed YAML files as JSON: one file per YAML file path, with the content hash
+_YAML_CACHE_FOLDER = platformdirs.user_cache_path() / "pamila" / "yaml"
+
+_PARSED_YAML = OrderedDict()  # _PARSED_YAML[hash of YAML content] = data
+# Callers get copies, since the loaded definitions become public attributes of
+# each `MachineConfig`, which may be modified in place.
+_MAX_N_PARSED_YAML = 64  # Least recently used entries beyond this are dropped.
+_PARSED_YAML_LOCK = threading.Lock()  # Machines may be loaded from several threads.
+
+# Definition files in a config folder (bundle key: filename)
+_DEFINITION_FILES = {
+    "sim_pvs": "sim_pvs.json",
+    "simpv_elem_maps": "simpv_elem_maps.json",
+    "pv_elem_maps": "pv_elem_maps.json",
+    "elements": "elements.json",
+    "mlvls": "mlvls.yaml",  # optional
+    "mlvts": "mlvts.yaml",  # optional
+}
+_DEFINITIONS_BUNDLE_FILENAME = "definitions.bundle.json"
+
+
+def _new_spec_caches():
+    # Shared within one MLV construction pass. Keys are derived from the contents
+    # of the definitions, except for "pvinfo_dicts" (keyed by `id(ch_def)`).
+    return dict(func_specs={}, unitconvs={}, set_wait_opts={}, pvinfo_dicts={})
+
+
+def _load_json_file(fp: Path):
+    return _parse_json(fp.read_bytes())
+
+
+def _parse_json(content: bytes):
+    try:
+        return _json_loads(content)
+    except ValueError:
+        # orjson rejects some input the standard parser accepts (e.g., NaN).
+        return json.loads(content)
+
+
+def _get_content_digest(content: bytes):
+    return hashlib.blake2b(content, digest_size=20).hexdigest()
+
+
+def _has_non_str_keys(obj):
+    # JSON turns such keys into strings, so the data would not survive a round trip.
+    if isinstance(obj, dict):
+        return any(
+            (not isinstance(k, str)) or _has_non_str_keys(v) for k, v in obj.items()
+        )
+    elif isinstance(obj, list):
+        return any(_has_non_str_keys(v) for v in obj)
+    else:
+        return False
+
+
+def _load_yaml_file(fp: Path):
+    # Cached in memory & on disk, as YAML parsing is much slower than JSON
+
+    content = fp.read_bytes()
+    digest = _get_content_digest(content)
+
+    with _PARSED_YAML_LOCK:
+        if digest in _PARSED_YAML:
+            _PARSED_YAML.move_to_end(digest)
+            return copy.deepcopy(_PARSED_YAML[digest])
+
+    path_digest = _get_content_digest(str(fp.resolve()).encode())
+    cache_fp = _YAML_CACHE_FOLDER / f"{path_digest}.json"
+
+    try:
+        cached = _load_json_file(cache_fp)
+    except (OSError, ValueError):
+        cached = None
+
+    if isinstance(cached, dict) and (cached.get("digest", None) == digest):
+        data = cached["data"]
+    else:
+        data = yaml_loads(content)
+        # Replaces the entry for the previous content of the file, if any
+        _write_yaml_cache_file(cache_fp, digest, data)
+
+    with _PARSED_YAML_LOCK:
+        _PARSED_YAML[digest] = data
+        _PARSED_YAML.move_to_end(digest)
+        while len(_PARSED_YAML) > _MAX_N_PARSED_YAML:
+            _PARSED_YAML.popitem(last=False)
+
+    return copy.deepcopy(data)
+
+
+def _write_yaml_cache_file(cache_fp: Path, digest: str, data):
+
+    if _has_non_str_keys(data):
+        return
+
+    try:
+        text = json.dumps(dict(digest=digest, data=data))
+    except (TypeError, ValueError):
+        return  # Not representable in JSON
+
+    tmp_fp = cache_fp.with_name(
+        f"{cache_fp.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        cache_fp.parent.mkdir(parents=True, exist_ok=True)
+        tmp_fp.write_text(text)
+        os.replace(tmp_fp, cache_fp)
+    except OSError:
+        pass  # The cache is optional (e.g., the cache folder may be read-only).
+    finally:
+        tmp_fp.unlink(missing_ok=True)
+
+
+def _load_optional_yaml_file(fp: Path):
+    if fp.exists():
+        return _load_yaml_file(fp)
+    else:
+        return None
+
+
+def _check_elem_name_pvid_uniqueness(elem_name_pvid_to_pvinfo, pv_elem_maps):
+    # Duplicate (elem_name, pvid) pairs leave fewer entries than pairs.
+
+    n_pairs = sum(len(d["elem_names"]) for d in pv_elem_maps.values())
+    n_entries = sum(len(v) for v in elem_name_pvid_to_pvinfo.values())
+    if n_entries == n_pairs:
+        return
+
+    seen = set()
+    duplicates = set()
+    for d in pv_elem_maps.values():
+        for elem_name in d["elem_names"]:
+            k = (elem_name, d["pvid_in_elem"])
+            if k in seen:
+                duplicates.add(k)
+            else:
+                seen.add(k)
+
+    raise ValueError(f"Duplicate (elem_name, pvid_in_elem) pairs: {sorted(duplicates)}")
+
+
+def _get_file_digest(fp: Path):
+    try:
+        return _get_content_digest(fp.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def _load_definitions_bundle(folder: Path):
+
+    try:
+        bundle = _load_json_file(folder / _DEFINITIONS_BUNDLE_FILENAME)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(bundle, dict) or (set(bundle) != {"src_digests", "definitions"}):
+        return None
+
+    # Stale if any definition file was modified, added or removed since
+    src_digests = bundle["src_digests"]
+    for filename in _DEFINITION_FILES.values():
+        if _get_file_digest(folder / filename) != src_digests.get(filename, None):
+            return None
+
+    defs = bundle["definitions"]
+    if not isinstance(defs, dict) or (set(defs) != set(_DEFINITION_FILES)):
+        return None
+
+    return defs
+
+
+def write_definitions_bundle(config_folder: Path | str):
+    # See "Bundling the definition files" in README.md
+
+    folder = Path(config_folder)
+
+    src_digests = {}
+    defs = {}
+    for key, filename in _DEFINITION_FILES.items():
+        fp = folder / filename
+        is_yaml = filename.endswith(".yaml")
+        try:
+            content = fp.read_bytes()
+        except FileNotFoundError:
+            if not is_yaml:  # Only the YAML files are optional
+                raise
+            src_digests[filename] = defs[key] = None
+            continue
+
+        # Digest & definitions from the same bytes, so that they always match
+        src_digests[filename] = _get_content_digest(content)
+        defs[key] = yaml_loads(content) if is_yaml else _parse_json(content)
+
+    if _has_non_str_keys(defs):
+        raise ValueError(
+            "Definitions with non-string mapping keys cannot be bundled, as "
+            "JSON would turn the keys into strings."
+        )
+
+    text = json.dumps(dict(src_digests=src_digests, definitions=defs))
+
+    bundle_fp = folder / _DEFINITIONS_BUNDLE_FILENAME
+    tmp_fp = bundle_fp.with_name(
+        f"{bundle_fp.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        tmp_fp.write_text(text)
+        os.replace(tmp_fp, bundle_fp)
+    finally:
+        tmp_fp.unlink(missing_ok=True)
+
+    return bundle_fp
+
+
+@cache
+def _get_sim_interface_path(machine_name: str, machine_mode: MachineMode):
+    return SimulatorInterfacePath(machine_name=machine_name, machine_mode=machine_mode)
+
 
 def create_pdev_psig_names(mlv_name, machine_mode):
-    match machine_mode:
-        case MachineMode.LIVE:
-            pdev_prefix = "epdL"  # external pamila device (LIVE)
-            psig_prefix = "epsL"  # external pamila signal (LIVE)
-        case MachineMode.DIGITAL_TWIN:
-            pdev_prefix = "epdD"  # external pamila device (DT)
-            psig_prefix = "epsD"  # external pamila signal (DT)
-        case MachineMode.SIMULATOR:
-            pdev_prefix = "ipd"  # internal pamila device
-            psig_prefix = "ips"  # internal pamila signal
-        case _:
-            raise ValueError
+    prefixes = _PDEV_PSIG_PREFIXES.get(machine_mode, None)
+    if prefixes is None:
+        raise ValueError
+    pdev_prefix, psig_prefix = prefixes
 
     pdev_name = f"{pdev_prefix}_{mlv_name}"
     psig_name_prefix = f"{psig_prefix}_{mlv_name}"
@@ -84,103 +328,158 @@ def get_unitconv(
     in_reprs: List[str],
     out_reprs: List[str],
     conv_spec_name: str | None,
+    spec_caches: Dict | None = None,
 ):
 
+    if spec_caches is None:
+        spec_caches = _new_spec_caches()
+
+    repr_units = elem_def["repr_units"]
+    src_units = tuple(repr_units[repr] for repr in in_reprs)
+    dst_units = tuple(repr_units[repr] for repr in out_reprs)
+
     if conv_spec_name in (None, "identity"):
-        func_spec = dict(name="identity")  # identity unit conversion
+        func_spec = None
+        func_key = None
     else:
         func_spec = elem_def["func_specs"][conv_spec_name]
+        try:
+            func_key = json.dumps(func_spec, sort_keys=True)
+        except TypeError:  # e.g., numpy arrays or `Q_` values in the arguments
+            return UnitConvSpec(
+                src_units=list(src_units),
+                dst_units=list(dst_units),
+                func_spec=FunctionSpec(**func_spec),
+            )
 
-    func_spec_obj = FunctionSpec(**func_spec)
-
-    src_units = [elem_def["repr_units"][repr] for repr in in_reprs]
-    dst_units = [elem_def["repr_units"][repr] for repr in out_reprs]
+    unitconvs = spec_caches["unitconvs"]
+    key = (func_key, src_units, dst_units)
+    unitconv_spec_obj = unitconvs.get(key, None)
+    if unitconv_spec_obj is not None:
+        return unitconv_spec_obj
 
-    unitconv_spec_obj = UnitConvSpec(
-        src_units=src_units,
-        dst_units=dst_units,
+    if func_spec is None:
+        func_spec_obj = _IDENTITY_FUNC_SPEC
+    else:
+        func_specs = spec_caches["func_specs"]
+        func_spec_obj = func_specs.get(func_key, None)
+        if func_spec_obj is None:
+            func_spec_obj = func_specs[func_key] = FunctionSpec(**func_spec)
+
+    unitconv_spec_obj = unitconvs[key] = UnitConvSpec(
+        src_units=list(src_units),
+        dst_units=list(dst_units),
         func_spec=func_spec_obj,
     )
 
     return unitconv_spec_obj
 
 
+def _get_LoLv_sig_class_and_cpt_kwargs(
+    ext_or_int: Literal["ext", "int"],
+    sig_type: Literal["Signal", "SignalRO"],
+    control_system: Literal["epics", "tango"],
+    simulator_interface_path,
+):
+    if ext_or_int == "ext":
+        return ExternalPamilaSignals[control_system][sig_type], {}
+    else:
+        return InternalPamilaSignals[sig_type], dict(
+            simulator_interface_path=simulator_interface_path
+        )
+
+
 def get_pvids_in_elem(ch_def):
+    return {
+        ext_or_int: _get_pvids_in_elem(ch_def, ext_or_int)
+        for ext_or_int in ["ext", "int"]
+        if ext_or_int in ch_def
+    }
+
+
+def get_aux_pvids_in_elem(ch_def):
     pvids_in_elem_d = {}
 
     for ext_or_int in ["ext", "int"]:
         if ext_or_int not in ch_def:
             continue
 
-        pvids_in_elem_d[ext_or_int] = {}
-        if "get" in ch_def[ext_or_int]:
-            pvids_in_elem_d[ext_or_int]["get"] = ch_def[ext_or_int]["get"]["input_pvs"]
-        if "put" in ch_def[ext_or_int]:
-            pvids_in_elem_d[ext_or_int]["put"] = ch_def[ext_or_int]["put"]["output_pvs"]
+        put_d = ch_def[ext_or_int].get("put", {})
+        pvids_in_elem_d[ext_or_int] = put_d.get("aux_input_pvs", {})
 
     return pvids_in_elem_d
 
 
-def get_aux_pvids_in_elem(ch_def):
+def _get_pvids_in_elem(ch_def, ext_or_int: Literal["ext", "int"]):
+    ch_pvs = ch_def[ext_or_int]
+
     pvids_in_elem_d = {}
+    if "get" in ch_pvs:
+        pvids_in_elem_d["get"] = ch_pvs["get"]["input_pvs"]
+    if "put" in ch_pvs:
+        pvids_in_elem_d["put"] = ch_pvs["put"]["output_pvs"]
 
-    for ext_or_int in ["ext", "int"]:
-        if ext_or_int not in ch_def:
-            continue
+    return pvids_in_elem_d
 
-        pvids_in_elem_d[ext_or_int] = {}
-        if "put" in ch_def[ext_or_int]:
-            if "aux_input_pvs" in ch_def[ext_or_int]["put"]:
-                pvids_in_elem_d[ext_or_int] = ch_def[ext_or_int]["put"]["aux_input_pvs"]
 
-    return pvids_in_elem_d
+def _get_aux_pvids_in_elem(ch_def, ext_or_int: Literal["ext", "int"]):
+    return ch_def[ext_or_int].get("put", {}).get("aux_input_pvs", [])
 
 
 def get_ext_or_int(machine_mode: MachineMode):
-    if machine_mode in (MachineMode.LIVE, MachineMode.DIGITAL_TWIN):
-        ext_or_int = "ext"
-    else:
-        ext_or_int = "int"
-    return ext_or_int
+    return _EXT_OR_INT[machine_mode]
 
 
-def _get_pvinfo_dict(ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode):
+def _get_pvinfo_dict(
+    ch_def,
+    elem_name_pvid_to_pvinfo,
+    elem_name,
+    ext_or_int: Literal["ext", "int"],
+    spec_caches: Dict | None,
+):
 
-    ext_or_int = get_ext_or_int(machine_mode)
+    # LIVE & DIGITAL_TWIN both resolve to the same "ext" PV info lists
+    if spec_caches is not None:
+        pvinfo_dicts = spec_caches["pvinfo_dicts"]
+        key = (id(ch_def), elem_name, ext_or_int)
+        info_list_d = pvinfo_dicts.get(key, None)
+        if info_list_d is not None:
+            return info_list_d
 
-    pvids_in_elem_d = get_pvids_in_elem(ch_def)
+    pvids_in_elem_d = _get_pvids_in_elem(ch_def, ext_or_int)
+    pvid_to_pvinfo = elem_name_pvid_to_pvinfo[ext_or_int][elem_name]
 
     info_list_d = {}
-    for get_or_put, pvid_list_in_elem in pvids_in_elem_d[ext_or_int].items():
+    for get_or_put, pvid_list_in_elem in pvids_in_elem_d.items():
         info_list_d[get_or_put] = [
-            elem_name_pvid_to_pvinfo[ext_or_int][(elem_name, pvid_in_elem)]
-            for pvid_in_elem in pvid_list_in_elem
+            pvid_to_pvinfo[pvid_in_elem] for pvid_in_elem in pvid_list_in_elem
         ]
 
-    return ext_or_int, info_list_d
+    if spec_caches is not None:
+        pvinfo_dicts[key] = info_list_d
+
+    return info_list_d
 
 
 def get_pvnames(ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode):
 
-    ext_or_int, info_dict = _get_pvinfo_dict(
-        ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode
+    ext_or_int = get_ext_or_int(machine_mode)
+    info_dict = _get_pvinfo_dict(
+        ch_def, elem_name_pvid_to_pvinfo, elem_name, ext_or_int, None
     )
 
     if ext_or_int == "ext":
+        mode_str = machine_mode.value
         pvname_d = {
-            get_or_put: [info["pvname"][machine_mode.value] for info in info_list]
+            get_or_put: [info["pvname"][mode_str] for info in info_list]
             for get_or_put, info_list in info_dict.items()
         }
     else:
         pvprefix = get_sim_pvprefix(machine_mode)
-        pvname_d = {}
-        for get_or_put, info_list in info_dict.items():
-            pvname_list = []
-            for info in info_list:
-                pvsuffix = info["pvsuffix"]
-                pvname = f"{pvprefix}{pvsuffix}"
-                pvname_list.append(pvname)
-            pvname_d[get_or_put] = pvname_list
+        pvname_d = {
+            get_or_put: [pvprefix + info["pvsuffix"] for info in info_list]
+            for get_or_put, info_list in info_dict.items()
+        }
 
     return pvname_d
 
@@ -189,38 +488,41 @@ def get_aux_input_pvnames_pvunits(
     ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode, ext_or_int
 ):
 
-    pvid_in_elem_list = get_aux_pvids_in_elem(ch_def)[ext_or_int]
+    pvid_in_elem_list = _get_aux_pvids_in_elem(ch_def, ext_or_int)
+    if not pvid_in_elem_list:
+        return [], []
 
-    info_list = [
-        elem_name_pvid_to_pvinfo[ext_or_int][(elem_name, pvid_in_elem)]
-        for pvid_in_elem in pvid_in_elem_list
-    ]
+    pvid_to_pvinfo = elem_name_pvid_to_pvinfo[ext_or_int][elem_name]
 
+    pvname_list = []
+    pvunit_list = []
     if ext_or_int == "ext":
-        pvname_list = [info["pvname"][machine_mode.value] for info in info_list]
-        pvunit_list = [info["pvunit"][machine_mode.value] for info in info_list]
+        mode_str = machine_mode.value
+        for pvid_in_elem in pvid_in_elem_list:
+            info = pvid_to_pvinfo[pvid_in_elem]
+            pvname_list.append(info["pvname"][mode_str])
+            pvunit_list.append(info["pvunit"][mode_str])
     else:
         pvprefix = get_sim_pvprefix(machine_mode)
-        pvname_list = []
-        for info in info_list:
-            pvsuffix = info["pvsuffix"]
-            pvname = f"{pvprefix}{pvsuffix}"
-            pvname_list.append(pvname)
-
-        pvunit_list = [info["pvunit"] for info in info_list]
+        for pvid_in_elem in pvid_in_elem_list:
+            info = pvid_to_pvinfo[pvid_in_elem]
+            pvname_list.append(pvprefix + info["pvsuffix"])
+            pvunit_list.append(info["pvunit"])
 
     return pvname_list, pvunit_list
 
 
 def get_pvunits(ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode):
 
-    ext_or_int, info_dict = _get_pvinfo_dict(
-        ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode
+    ext_or_int = get_ext_or_int(machine_mode)
+    info_dict = _get_pvinfo_dict(
+        ch_def, elem_name_pvid_to_pvinfo, elem_name, ext_or_int, None
     )
 
     if ext_or_int == "ext":
+        mode_str = machine_mode.value
         pvunit_d = {
-            get_or_put: [info["pvunit"][machine_mode.value] for info in info_list]
+            get_or_put: [info["pvunit"][mode_str] for info in info_list]
             for get_or_put, info_list in info_dict.items()
         }
     else:
@@ -232,13 +534,76 @@ def get_pvunits(ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode):
     return pvunit_d
 
 
+def get_pvnames_pvunits(
+    ch_def,
+    elem_name_pvid_to_pvinfo,
+    elem_name,
+    machine_mode,
+    ext_or_int,
+    spec_caches: Dict | None = None,
+):
+    # `get_pvnames` & `get_pvunits` in a single pass
+
+    info_dict = _get_pvinfo_dict(
+        ch_def, elem_name_pvid_to_pvinfo, elem_name, ext_or_int, spec_caches
+    )
+
+    pvname_d = {}
+    pvunit_d = {}
+    if ext_or_int == "ext":
+        mode_str = machine_mode.value
+        for get_or_put, info_list in info_dict.items():
+            pvname_d[get_or_put] = [info["pvname"][mode_str] for info in info_list]
+            pvunit_d[get_or_put] = [info["pvunit"][mode_str] for info in info_list]
+    else:
+        pvprefix = get_sim_pvprefix(machine_mode)
+        for get_or_put, info_list in info_dict.items():
+            pvname_d[get_or_put] = [pvprefix + info["pvsuffix"] for info in info_list]
+            pvunit_d[get_or_put] = [info["pvunit"] for info in info_list]
+
+    return pvname_d, pvunit_d
+
+
+def _get_single_pvname_pvunit(
+    ch_def,
+    elem_name_pvid_to_pvinfo,
+    elem_name,
+    machine_mode,
+    ext_or_int,
+    get_or_puts,
+    spec_caches,
+):
+    # For channels whose actions (`get_or_puts`) all use the same single PV
+
+    info_dict = _get_pvinfo_dict(
+        ch_def, elem_name_pvid_to_pvinfo, elem_name, ext_or_int, spec_caches
+    )
+    assert tuple(info_dict) == get_or_puts
+
+    (info,) = info_dict[get_or_puts[0]]
+    assert all(info_list == [info] for info_list in info_dict.values())
+
+    if ext_or_int == "ext":
+        mode_str = machine_mode.value
+        pvname = info["pvname"][mode_str]
+        pvunit = info["pvunit"][mode_str]
+    else:
+        pvname = get_sim_pvprefix(machine_mode) + info["pvsuffix"]
+        pvunit = info["pvunit"]
+
+    return pvname, pvunit
+
+
 def get_reprs(elem_def, ext_or_int: Literal["ext", "int"], pvid_list: List[str]):
 
-    return [elem_def["pvid_to_repr_map"][ext_or_int][pvid] for pvid in pvid_list]
+    pvid_to_repr = elem_def["pvid_to_repr_map"][ext_or_int]
+
+    return [pvid_to_repr[pvid] for pvid in pvid_list]
 
 
 def _get_standard_RB_components(
     machine_mode: MachineMode,
+    ext_or_int: Literal["ext", "int"],
     LoLv_psig_name: str,
     HiLv_psig_name: str,
     elem_def,
@@ -247,37 +612,29 @@ def _get_standard_RB_components(
     elem_name,
     simulator_interface_path,
     control_system: Literal["epics", "tango"],
+    spec_caches,
 ):
 
     assert ch_def["handle"] == "RB"
 
-    match get_ext_or_int(machine_mode):
-        case "ext":
-            LoLv_sig_class = ExternalPamilaSignals[control_system]["SignalRO"]
-            LoLv_cpt_kwargs = {}
-        case "int":
-            LoLv_sig_class = InternalPamilaSignalRO
-            LoLv_cpt_kwargs = dict(simulator_interface_path=simulator_interface_path)
-        case _:
-            raise ValueError
-
-    _LoLv_pv_units_d = get_pvunits(
-        ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode
+    LoLv_sig_class, LoLv_cpt_kwargs = _get_LoLv_sig_class_and_cpt_kwargs(
+        ext_or_int, "SignalRO", control_system, simulator_interface_path
+    )
+
+    pvname, LoLv_pv_unit = _get_single_pvname_pvunit(
+        ch_def,
+        elem_name_pvid_to_pvinfo,
+        elem_name,
+        machine_mode,
+        ext_or_int,
+        ("get",),
+        spec_caches,
     )
-    assert list(_LoLv_pv_units_d) == ["get"]
-    _LoLv_pv_units = _LoLv_pv_units_d["get"]
-    assert len(_LoLv_pv_units) == 1
-    LoLv_pv_unit = _LoLv_pv_units[0]
+
     out_reprs = ch_def["HiLv_reprs"]
     assert len(out_reprs) == 1
     mlv_unit = elem_def["repr_units"][out_reprs[0]]
 
-    _pvnames_d = get_pvnames(ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode)
-    assert list(_pvnames_d) == ["get"]
-    _pvnames = _pvnames_d["get"]
-    assert len(_pvnames) == 1
-    pvname = _pvnames[0]
-
     components = {
         "RB_LoLv": Cpt(
             LoLv_sig_class,
@@ -298,14 +655,17 @@ def _get_standard_RB_components(
     return components
 
 
-def _get_standard_RB_pdev_action_specs(elem_def, ch_def, ext_or_int):
+def _get_standard_RB_pdev_action_specs(elem_def, ch_def, ext_or_int, spec_caches):
 
-    in_reprs = get_reprs(elem_def, ext_or_int, ch_def[ext_or_int]["get"]["input_pvs"])
+    ch_pvs = ch_def[ext_or_int]
+
+    in_reprs = get_reprs(elem_def, ext_or_int, ch_pvs["get"]["input_pvs"])
     out_reprs = ch_def["HiLv_reprs"]
-    conv_spec_name = ch_def[ext_or_int]["get"].get("conv_spec_name", None)
-    unitconv = get_unitconv(elem_def, in_reprs, out_reprs, conv_spec_name)
+    conv_spec_name = ch_pvs["get"].get("conv_spec_name", None)
+    unitconv = get_unitconv(elem_def, in_reprs, out_reprs, conv_spec_name, spec_caches)
 
-    get_spec = PamilaDeviceActionSpec(
+    # No validation needed for action specs (no custom validators, typed fields)
+    get_spec = PamilaDeviceActionSpec.model_construct(
         input_cpt_attr_names=["RB_LoLv"],
         output_cpt_attr_names=["RB"],
         unitconv=unitconv,
@@ -324,14 +684,21 @@ def get_standard_RB_pdev_spec(
     elem_name,
     simulator_interface_path,
     control_system: Literal["epics", "tango"],
+    spec_caches: Dict | None = None,
 ):
 
+    if spec_caches is None:
+        spec_caches = _new_spec_caches()
+
     pdev_name, LoLv_psig_name = create_pdev_psig_names(mlv_name, machine_mode)
 
     HiLv_psig_name = f"{LoLv_psig_name}_HiLv"
 
+    ext_or_int = get_ext_or_int(machine_mode)
+
     components = _get_standard_RB_components(
         machine_mode,
+        ext_or_int,
         LoLv_psig_name,
         HiLv_psig_name,
         elem_def,
@@ -340,10 +707,12 @@ def get_standard_RB_pdev_spec(
         elem_name,
         simulator_interface_path,
         control_system,
+        spec_caches,
     )
 
-    ext_or_int = get_ext_or_int(machine_mode)
-    action_specs = _get_standard_RB_pdev_action_specs(elem_def, ch_def, ext_or_int)
+    action_specs = _get_standard_RB_pdev_action_specs(
+        elem_def, ch_def, ext_or_int, spec_caches
+    )
 
     simple_pdev_spec = SimplePamilaDeviceROSpec(
         pdev_name=pdev_name,
@@ -359,6 +728,7 @@ def get_standard_RB_pdev_spec(
 
 def _get_MIMO_RB_components(
     machine_mode: MachineMode,
+    ext_or_int: Literal["ext", "int"],
     psig_name_prefix: str,
     elem_def,
     ch_def,
@@ -366,55 +736,66 @@ def _get_MIMO_RB_components(
     elem_name,
     simulator_interface_path,
     control_system: Literal["epics", "tango"],
+    spec_caches,
 ):
 
     assert ch_def["handle"] == "RB"
 
-    match ext_or_int := get_ext_or_int(machine_mode):
-        case "ext":
-            LoLv_sig_class = ExternalPamilaSignals[control_system]["SignalRO"]
-            LoLv_cpt_kwargs = {}
-        case "int":
-            LoLv_sig_class = InternalPamilaSignalRO
-            LoLv_cpt_kwargs = dict(simulator_interface_path=simulator_interface_path)
-        case _:
-            raise ValueError
-
-    _pvnames = get_pvnames(ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode)
-    input_pvnames = _pvnames["get"]
+    LoLv_sig_class, LoLv_cpt_kwargs = _get_LoLv_sig_class_and_cpt_kwargs(
+        ext_or_int,
+        "SignalRO",
+        control_system,
+        simulator_interface_path,
+    )
 
-    _pv_units = get_pvunits(ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode)
+    # Arguments shared by all the components of each kind
+    LoLv_cpt = partial(Cpt, LoLv_sig_class, mode=machine_mode, **LoLv_cpt_kwargs)
+    user_cpt = partial(Cpt, UserPamilaSignal, mode=machine_mode)
+
+    _pvnames, _pv_units = get_pvnames_pvunits(
+        ch_def,
+        elem_name_pvid_to_pvinfo,
+        elem_name,
+        machine_mode,
+        ext_or_int,
+        spec_caches,
+    )
+    input_pvnames = _pvnames["get"]
     input_pv_units = _pv_units["get"]
 
+    # Component attribute names grouped by their roles
+    key_buckets = {"LoLv_RB_get_input": [], "RB_get_output": []}
+
     components = {}
     assert len(input_pvnames) == len(input_pv_units)
     for i, (LoLv_pvname, LoLv_pv_unit) in enumerate(zip(input_pvnames, input_pv_units)):
-        components[f"LoLv_RB_get_input_{i}"] = Cpt(
-            LoLv_sig_class,
+        k = f"LoLv_RB_get_input_{i}"
+        key_buckets["LoLv_RB_get_input"].append(k)
+        components[k] = LoLv_cpt(
             LoLv_pvname,
-            mode=machine_mode,
             name=f"{psig_name_prefix}_get_input_{i}",  # signal name
             unit=LoLv_pv_unit,
-            **LoLv_cpt_kwargs,
         )
 
     out_reprs = ch_def["HiLv_reprs"]
 
     # High-level or user-level units
-    mlv_units = [elem_def["repr_units"][_repr] for _repr in out_reprs]
+    repr_units = elem_def["repr_units"]
+    mlv_units = [repr_units[_repr] for _repr in out_reprs]
 
     for i, mlv_unit in enumerate(mlv_units):
-        components[f"RB_get_output_{i}"] = Cpt(
-            UserPamilaSignal,
-            mode=machine_mode,
-            name=f"{psig_name_prefix}_get_output_{i}",
-            unit=mlv_unit,
+        k = f"RB_get_output_{i}"
+        key_buckets["RB_get_output"].append(k)
+        components[k] = user_cpt(
+            name=f"{psig_name_prefix}_get_output_{i}", unit=mlv_unit
         )
 
-    return components
+    return components, key_buckets
 
 
-def _get_MIMO_RB_pdev_action_specs(elem_def, ch_def, ext_or_int, components_keys):
+def _get_MIMO_RB_pdev_action_specs(
+    elem_def, ch_def, ext_or_int, key_buckets, spec_caches
+):
 
     HiLv_reprs = ch_def["HiLv_reprs"]
 
@@ -425,15 +806,11 @@ def _get_MIMO_RB_pdev_action_specs(elem_def, ch_def, ext_or_int, components_keys
     out_reprs = HiLv_reprs
 
     conv_spec_name = ch_pvs["get"].get("conv_spec_name", None)
-    unitconv = get_unitconv(elem_def, in_reprs, out_reprs, conv_spec_name)
-
-    get_spec = PamilaDeviceActionSpec(
-        input_cpt_attr_names=[
-            k for k in components_keys if re.match("^LoLv_RB_get_input_\d+$", k)
-        ],
-        output_cpt_attr_names=[
-            k for k in components_keys if re.match("^RB_get_output_\d+$", k)
-        ],
+    unitconv = get_unitconv(elem_def, in_reprs, out_reprs, conv_spec_name, spec_caches)
+
+    get_spec = PamilaDeviceActionSpec.model_construct(
+        input_cpt_attr_names=key_buckets["LoLv_RB_get_input"],
+        output_cpt_attr_names=key_buckets["RB_get_output"],
         unitconv=unitconv,
     )
 
@@ -452,12 +829,19 @@ def get_MIMO_RB_pdev_spec(
     elem_name,
     simulator_interface_path,
     control_system: Literal["epics", "tango"],
+    spec_caches: Dict | None = None,
 ):
 
+    if spec_caches is None:
+        spec_caches = _new_spec_caches()
+
     pdev_name, psig_name_prefix = create_pdev_psig_names(mlv_name, machine_mode)
 
-    components = _get_MIMO_RB_components(
+    ext_or_int = get_ext_or_int(machine_mode)
+
+    components, key_buckets = _get_MIMO_RB_components(
         machine_mode,
+        ext_or_int,
         psig_name_prefix,
         elem_def,
         ch_def,
@@ -465,11 +849,11 @@ def get_MIMO_RB_pdev_spec(
         elem_name,
         simulator_interface_path,
         control_system,
+        spec_caches,
     )
 
-    ext_or_int = get_ext_or_int(machine_mode)
     action_specs = _get_MIMO_RB_pdev_action_specs(
-        elem_def, ch_def, ext_or_int, list(components)
+        elem_def, ch_def, ext_or_int, key_buckets, spec_caches
     )
 
     simple_pdev_spec = SimplePamilaDeviceROSpec(
@@ -486,6 +870,7 @@ def get_MIMO_RB_pdev_spec(
 
 def _get_standard_SP_components(
     machine_mode: MachineMode,
+    ext_or_int: Literal["ext", "int"],
     LoLv_psig_name: str,
     elem_def,
     ch_def,
@@ -494,39 +879,28 @@ def _get_standard_SP_components(
     simulator_interface_path,
     mode_pdev_def,
     control_system: Literal["epics", "tango"],
+    spec_caches,
 ):
     assert ch_def["handle"] == "SP"
 
-    match get_ext_or_int(machine_mode):
-        case "ext":
-            LoLv_sig_class = ExternalPamilaSignals[control_system]["Signal"]
-            LoLv_cpt_kwargs = {}
-        case "int":
-            LoLv_sig_class = InternalPamilaSignal
-            LoLv_cpt_kwargs = dict(simulator_interface_path=simulator_interface_path)
-        case _:
-            raise ValueError
-
-    _LoLv_pv_units_d = get_pvunits(
-        ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode
+    LoLv_sig_class, LoLv_cpt_kwargs = _get_LoLv_sig_class_and_cpt_kwargs(
+        ext_or_int, "Signal", control_system, simulator_interface_path
+    )
+
+    SP_pvname, LoLv_pv_unit = _get_single_pvname_pvunit(
+        ch_def,
+        elem_name_pvid_to_pvinfo,
+        elem_name,
+        machine_mode,
+        ext_or_int,
+        ("get", "put"),
+        spec_caches,
     )
-    assert _LoLv_pv_units_d["get"] == _LoLv_pv_units_d["put"]
-    _LoLv_pv_units = _LoLv_pv_units_d["get"]
-    assert len(_LoLv_pv_units) == 1
-    LoLv_pv_unit = _LoLv_pv_units[0]
 
     out_reprs = ch_def["HiLv_reprs"]
     assert len(out_reprs) == 1
     mlv_unit = elem_def["repr_units"][out_reprs[0]]
 
-    _SP_pvnames_d = get_pvnames(
-        ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode
-    )
-    assert _SP_pvnames_d["get"] == _SP_pvnames_d["put"]
-    _SP_pvnames = _SP_pvnames_d["get"]
-    assert len(_SP_pvnames) == 1
-    SP_pvname = _SP_pvnames[0]
-
     components = {
         "SP_LoLv": Cpt(
             LoLv_sig_class,
@@ -558,6 +932,7 @@ def _get_standard_SP_components(
         RB_HiLv_psig_name = f"{RB_LoLv_psig_name}_HiLv"
         RB_components = _get_standard_RB_components(
             machine_mode,
+            ext_or_int,
             RB_LoLv_psig_name,
             RB_HiLv_psig_name,
             elem_def,
@@ -566,6 +941,7 @@ def _get_standard_SP_components(
             elem_name,
             simulator_interface_path,
             control_system,
+            spec_caches,
         )
 
         components["RB_LoLv"] = RB_components["RB_LoLv"]
@@ -574,34 +950,36 @@ def _get_standard_SP_components(
     return components
 
 
-def _get_standard_SP_pdev_action_specs(elem_def, ch_def, ext_or_int, mode_pdev_def):
+def _get_standard_SP_pdev_action_specs(
+    elem_def, ch_def, ext_or_int, mode_pdev_def, spec_caches
+):
+
+    ch_pvs = ch_def[ext_or_int]
 
-    LoLv_reprs = get_reprs(elem_def, ext_or_int, ch_def[ext_or_int]["get"]["input_pvs"])
+    LoLv_reprs = get_reprs(elem_def, ext_or_int, ch_pvs["get"]["input_pvs"])
     HiLv_reprs = ch_def["HiLv_reprs"]
 
     in_reprs = LoLv_reprs
     out_reprs = HiLv_reprs
-    conv_spec_name = ch_def[ext_or_int]["get"].get("conv_spec_name", None)
-    unitconv = get_unitconv(elem_def, in_reprs, out_reprs, conv_spec_name)
+    conv_spec_name = ch_pvs["get"].get("conv_spec_name", None)
+    unitconv = get_unitconv(elem_def, in_reprs, out_reprs, conv_spec_name, spec_caches)
 
-    get_spec = PamilaDeviceActionSpec(
+    get_spec = PamilaDeviceActionSpec.model_construct(
         input_cpt_attr_names=["SP_LoLv"],
         output_cpt_attr_names=["SP"],
         unitconv=unitconv,
     )
 
     in_reprs = HiLv_reprs
-    put_LoLv_reprs = get_reprs(
-        elem_def, ext_or_int, ch_def[ext_or_int]["put"]["output_pvs"]
-    )
+    put_LoLv_reprs = get_reprs(elem_def, ext_or_int, ch_pvs["put"]["output_pvs"])
     assert LoLv_reprs == put_LoLv_reprs
 
     out_reprs = LoLv_reprs
 
-    conv_spec_name = ch_def[ext_or_int]["put"].get("conv_spec_name", None)
-    unitconv = get_unitconv(elem_def, in_reprs, out_reprs, conv_spec_name)
+    conv_spec_name = ch_pvs["put"].get("conv_spec_name", None)
+    unitconv = get_unitconv(elem_def, in_reprs, out_reprs, conv_spec_name, spec_caches)
 
-    put_spec = PamilaDeviceActionSpec(
+    put_spec = PamilaDeviceActionSpec.model_construct(
         input_cpt_attr_names=["SP_put_input"],
         output_cpt_attr_names=["SP_LoLv"],
         unitconv=unitconv,
@@ -613,17 +991,19 @@ def _get_standard_SP_pdev_action_specs(elem_def, ch_def, ext_or_int, mode_pdev_d
     if SP_RB_diff:
         RB_ch_def = elem_def["channel_map"][SP_RB_diff["RB_channel"]]
 
-        LoLv_reprs = get_reprs(
-            elem_def, ext_or_int, RB_ch_def[ext_or_int]["get"]["input_pvs"]
-        )
+        RB_ch_pvs = RB_ch_def[ext_or_int]
+
+        LoLv_reprs = get_reprs(elem_def, ext_or_int, RB_ch_pvs["get"]["input_pvs"])
         HiLv_reprs = RB_ch_def["HiLv_reprs"]
 
         in_reprs = LoLv_reprs
         out_reprs = HiLv_reprs
-        conv_spec_name = RB_ch_def[ext_or_int]["get"].get("conv_spec_name", None)
-        unitconv = get_unitconv(elem_def, in_reprs, out_reprs, conv_spec_name)
+        conv_spec_name = RB_ch_pvs["get"].get("conv_spec_name", None)
+        unitconv = get_unitconv(
+            elem_def, in_reprs, out_reprs, conv_spec_name, spec_caches
+        )
 
-        specs["readback_in_set"] = PamilaDeviceActionSpec(
+        specs["readback_in_set"] = PamilaDeviceActionSpec.model_construct(
             input_cpt_attr_names=["RB_LoLv"],
             output_cpt_attr_names=["RB"],
             unitconv=unitconv,
@@ -632,6 +1012,49 @@ def _get_standard_SP_pdev_action_specs(elem_def, ch_def, ext_or_int, mode_pdev_d
     return specs
 
 
+def _get_shared_set_wait_opts(model_class, opts_d: Dict, spec_caches: Dict):
+
+    try:
+        k = (model_class, json.dumps(opts_d, sort_keys=True))
+    except TypeError:  # e.g., `Q_` values passed to the public pdev spec builders
+        return model_class(**opts_d)
+
+    set_wait_opts = spec_caches["set_wait_opts"]
+    opts = set_wait_opts.get(k, None)
+    if opts is None:
+        opts = set_wait_opts[k] = model_class(**opts_d)
+
+    return opts
+
+
+def _get_set_wait_spec_and_method(mode_pdev_def: Dict, spec_caches: Dict):
+
+    get = mode_pdev_def.get
+
+    fixed_wait_time_d = get("fixed_wait_time", None)
+    if fixed_wait_time_d:
+        fixed_wait_time = _get_shared_set_wait_opts(
+            FixedWaitTime, fixed_wait_time_d, spec_caches
+        )
+    else:
+        fixed_wait_time = None
+
+    SP_RB_diff_d = get("SP_RB_diff", None)
+    if SP_RB_diff_d:
+        # Build a new dict so that `mode_pdev_def` is left untouched
+        SP_RB_diff_d = {k: v for k, v in SP_RB_diff_d.items() if k != "RB_channel"}
+        SP_RB_diff_d["RB_attr_name"] = "RB"
+        SP_RB_diff = _get_shared_set_wait_opts(
+            SetpointReadbackDiff, SP_RB_diff_d, spec_caches
+        )
+    else:
+        SP_RB_diff = None
+
+    set_wait_spec = SetWaitSpec(fixed_wait_time=fixed_wait_time, SP_RB_diff=SP_RB_diff)
+
+    return set_wait_spec, get("set_wait_method", "fixed_wait_time")
+
+
 def get_standard_SP_pdev_spec(
     mlv_name: str,
     machine_name: str,
@@ -643,12 +1066,19 @@ def get_standard_SP_pdev_spec(
     simulator_interface_path,
     mode_pdev_def,
     control_system: Literal["epics", "tango"],
+    spec_caches: Dict | None = None,
 ):
 
+    if spec_caches is None:
+        spec_caches = _new_spec_caches()
+
     pdev_name, LoLv_psig_name = create_pdev_psig_names(mlv_name, machine_mode)
 
+    ext_or_int = get_ext_or_int(machine_mode)
+
     components = _get_standard_SP_components(
         machine_mode,
+        ext_or_int,
         LoLv_psig_name,
         elem_def,
         ch_def,
@@ -657,26 +1087,16 @@ def get_standard_SP_pdev_spec(
         simulator_interface_path,
         mode_pdev_def,
         control_system,
+        spec_caches,
     )
 
-    ext_or_int = get_ext_or_int(machine_mode)
     action_specs = _get_standard_SP_pdev_action_specs(
-        elem_def, ch_def, ext_or_int, mode_pdev_def
+        elem_def, ch_def, ext_or_int, mode_pdev_def, spec_caches
     )
 
-    fixed_wait_time_d = mode_pdev_def.get("fixed_wait_time", None)
-    if fixed_wait_time_d:
-        fixed_wait_time = FixedWaitTime(**fixed_wait_time_d)
-    else:
-        fixed_wait_time = None
-
-    SP_RB_diff_d = mode_pdev_def.get("SP_RB_diff", None)
-    if SP_RB_diff_d:
-        SP_RB_diff_d["RB_attr_name"] = "RB"
-        del SP_RB_diff_d["RB_channel"]
-        SP_RB_diff = SetpointReadbackDiff(**SP_RB_diff_d)
-    else:
-        SP_RB_diff = None
+    set_wait_spec, set_wait_method = _get_set_wait_spec_and_method(
+        mode_pdev_def, spec_caches
+    )
 
     simple_pdev_spec = SimplePamilaDeviceSpec(
         pdev_name=pdev_name,
@@ -687,10 +1107,8 @@ def get_standard_SP_pdev_spec(
         get_spec=action_specs["get"],
         put_spec=action_specs["put"],
         readback_in_set=action_specs.get("readback_in_set", None),
-        set_wait_spec=SetWaitSpec(
-            fixed_wait_time=fixed_wait_time, SP_RB_diff=SP_RB_diff
-        ),
-        set_wait_method=mode_pdev_def.get("set_wait_method", "fixed_wait_time"),
+        set_wait_spec=set_wait_spec,
+        set_wait_method=set_wait_method,
     )
 
     return simple_pdev_spec
@@ -698,6 +1116,7 @@ def get_standard_SP_pdev_spec(
 
 def _get_MIMO_SP_components(
     machine_mode: MachineMode,
+    ext_or_int: Literal["ext", "int"],
     psig_name_prefix: str,
     elem_def,
     ch_def,
@@ -706,62 +1125,71 @@ def _get_MIMO_SP_components(
     simulator_interface_path,
     mode_pdev_def,
     control_system: Literal["epics", "tango"],
+    spec_caches,
 ):
     assert ch_def["handle"] == "SP"
 
-    match ext_or_int := get_ext_or_int(machine_mode):
-        case "ext":
-            LoLv_sig_class = ExternalPamilaSignals[control_system]["Signal"]
-            LoLv_cpt_kwargs = {}
-        case "int":
-            LoLv_sig_class = InternalPamilaSignal
-            LoLv_cpt_kwargs = dict(simulator_interface_path=simulator_interface_path)
-        case _:
-            raise ValueError
-
-    _SP_pvnames = get_pvnames(ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode)
-    SP_get_input_pvnames = _SP_pvnames["get"]
-    SP_put_output_pvnames = _SP_pvnames["put"]
+    LoLv_sig_class, LoLv_cpt_kwargs = _get_LoLv_sig_class_and_cpt_kwargs(
+        ext_or_int, "Signal", control_system, simulator_interface_path
+    )
 
-    _SP_pv_units = get_pvunits(
-        ch_def, elem_name_pvid_to_pvinfo, elem_name, machine_mode
+    # Arguments shared by all the components of each kind
+    LoLv_cpt = partial(Cpt, LoLv_sig_class, mode=machine_mode, **LoLv_cpt_kwargs)
+    user_cpt = partial(Cpt, UserPamilaSignal, mode=machine_mode)
+
+    _SP_pvnames, _SP_pv_units = get_pvnames_pvunits(
+        ch_def,
+        elem_name_pvid_to_pvinfo,
+        elem_name,
+        machine_mode,
+        ext_or_int,
+        spec_caches,
     )
+    SP_get_input_pvnames = _SP_pvnames["get"]
+    SP_put_output_pvnames = _SP_pvnames["put"]
     SP_get_input_pvunits = _SP_pv_units["get"]
     SP_put_output_pvunits = _SP_pv_units["put"]
 
+    # Component attribute names grouped by their roles
+    key_buckets = {
+        "LoLv_SP_get_input": [],
+        "SP_get_output": [],
+        "SP_put_input": [],
+        "LoLv_SP_put_aux_input": [],
+        "LoLv_SP_put_output": [],
+    }
+
     components = {}
     assert len(SP_get_input_pvnames) == len(SP_get_input_pvunits)
     for i, (LoLv_pvname, LoLv_pv_unit) in enumerate(
         zip(SP_get_input_pvnames, SP_get_input_pvunits)
     ):
-        components[f"LoLv_SP_get_input_{i}"] = Cpt(
-            LoLv_sig_class,
+        k = f"LoLv_SP_get_input_{i}"
+        key_buckets["LoLv_SP_get_input"].append(k)
+        components[k] = LoLv_cpt(
             LoLv_pvname,
-            mode=machine_mode,
             name=f"{psig_name_prefix}_get_input_{i}",  # signal name
             unit=LoLv_pv_unit,
-            **LoLv_cpt_kwargs,
         )
 
     out_reprs = ch_def["HiLv_reprs"]
 
     # High-level or user-level units
-    mlv_units = [elem_def["repr_units"][_repr] for _repr in out_reprs]
+    repr_units = elem_def["repr_units"]
+    mlv_units = [repr_units[_repr] for _repr in out_reprs]
 
     for i, mlv_unit in enumerate(mlv_units):
-        components[f"SP_get_output_{i}"] = Cpt(
-            UserPamilaSignal,
-            mode=machine_mode,
-            name=f"{psig_name_prefix}_get_output_{i}",
-            unit=mlv_unit,
+        k = f"SP_get_output_{i}"
+        key_buckets["SP_get_output"].append(k)
+        components[k] = user_cpt(
+            name=f"{psig_name_prefix}_get_output_{i}", unit=mlv_unit
         )
 
     for i, mlv_unit in enumerate(mlv_units):
-        components[f"SP_put_input_{i}"] = Cpt(
-            UserPamilaSignal,
-            mode=machine_mode,
-            name=f"{psig_name_prefix}_put_input_{i}",
-            unit=mlv_unit,
+        k = f"SP_put_input_{i}"
+        key_buckets["SP_put_input"].append(k)
+        components[k] = user_cpt(
+            name=f"{psig_name_prefix}_put_input_{i}", unit=mlv_unit
         )
 
     # Auxiliary input PVs should exist, if any, only for "put" (not for "get")
@@ -771,25 +1199,23 @@ def _get_MIMO_SP_components(
     for i, (LoLv_pvname, LoLv_pv_unit) in enumerate(
         zip(aux_input_pvnames, aux_input_pvunits)
     ):
-        components[f"LoLv_SP_put_aux_input_{i}"] = Cpt(
-            LoLv_sig_class,
+        k = f"LoLv_SP_put_aux_input_{i}"
+        key_buckets["LoLv_SP_put_aux_input"].append(k)
+        components[k] = LoLv_cpt(
             LoLv_pvname,
-            mode=machine_mode,
             name=f"{psig_name_prefix}_put_aux_input_{i}",  # signal name
             unit=LoLv_pv_unit,
-            **LoLv_cpt_kwargs,
         )
 
     for i, (LoLv_pvname, LoLv_pv_unit) in enumerate(
         zip(SP_put_output_pvnames, SP_put_output_pvunits)
     ):
-        components[f"LoLv_SP_put_output_{i}"] = Cpt(
-            LoLv_sig_class,
+        k = f"LoLv_SP_put_output_{i}"
+        key_buckets["LoLv_SP_put_output"].append(k)
+        components[k] = LoLv_cpt(
             LoLv_pvname,
-            mode=machine_mode,
             name=f"{psig_name_prefix}_put_output_{i}",  # signal name
             unit=LoLv_pv_unit,
-            **LoLv_cpt_kwargs,
         )
 
     SP_RB_diff = mode_pdev_def.get("SP_RB_diff", {})
@@ -798,8 +1224,9 @@ def _get_MIMO_SP_components(
         RB_ch_def = elem_def["channel_map"][SP_RB_diff["RB_channel"]]
         RB_LoLv_psig_name = f"{psig_name_prefix}_RB"
         RB_HiLv_psig_name = f"{RB_LoLv_psig_name}_HiLv"
-        RB_components = _get_MIMO_RB_components(
+        RB_components, _ = _get_MIMO_RB_components(
             machine_mode,
+            ext_or_int,
             RB_LoLv_psig_name,
             RB_HiLv_psig_name,
             elem_def,
@@ -807,16 +1234,17 @@ def _get_MIMO_SP_components(
             elem_name_pvid_to_pvinfo,
             elem_name,
             simulator_interface_path,
+            spec_caches=spec_caches,
         )
 
         components["RB_LoLv"] = RB_components["RB_LoLv"]
         components["RB"] = RB_components["RB"]
 
-    return components
+    return components, key_buckets
 
 
 def _get_MIMO_SP_pdev_action_specs(
-    elem_def, ch_def, ext_or_int, components_keys, mode_pdev_def
+    elem_def, ch_def, ext_or_int, key_buckets, mode_pdev_def, spec_caches
 ):
 
     HiLv_reprs = ch_def["HiLv_reprs"]
@@ -831,15 +1259,11 @@ def _get_MIMO_SP_pdev_action_specs(
     out_reprs = HiLv_reprs
 
     conv_spec_name = ch_pvs["get"].get("conv_spec_name", None)
-    unitconv = get_unitconv(elem_def, in_reprs, out_reprs, conv_spec_name)
-
-    get_spec = PamilaDeviceActionSpec(
-        input_cpt_attr_names=[
-            k for k in components_keys if re.match("^LoLv_SP_get_input_\d+$", k)
-        ],
-        output_cpt_attr_names=[
-            k for k in components_keys if re.match("^SP_get_output_\d+$", k)
-        ],
+    unitconv = get_unitconv(elem_def, in_reprs, out_reprs, conv_spec_name, spec_caches)
+
+    get_spec = PamilaDeviceActionSpec.model_construct(
+        input_cpt_attr_names=key_buckets["LoLv_SP_get_input"],
+        output_cpt_attr_names=key_buckets["SP_get_output"],
         unitconv=unitconv,
     )
 
@@ -850,18 +1274,12 @@ def _get_MIMO_SP_pdev_action_specs(
     out_reprs = get_reprs(elem_def, ext_or_int, ch_pvs["put"]["output_pvs"])
 
     conv_spec_name = ch_pvs["put"].get("conv_spec_name", None)
-    unitconv = get_unitconv(elem_def, in_reprs, out_reprs, conv_spec_name)
-
-    put_spec = PamilaDeviceActionSpec(
-        input_cpt_attr_names=[
-            k for k in components_keys if re.match("^SP_put_input_\d+$", k)
-        ],
-        aux_input_cpt_attr_names=[
-            k for k in components_keys if re.match("^LoLv_SP_put_aux_input_\d+$", k)
-        ],
-        output_cpt_attr_names=[
-            k for k in components_keys if re.match("^LoLv_SP_put_output_\d+$", k)
-        ],
+    unitconv = get_unitconv(elem_def, in_reprs, out_reprs, conv_spec_name, spec_caches)
+
+    put_spec = PamilaDeviceActionSpec.model_construct(
+        input_cpt_attr_names=key_buckets["SP_put_input"],
+        aux_input_cpt_attr_names=key_buckets["LoLv_SP_put_aux_input"],
+        output_cpt_attr_names=key_buckets["LoLv_SP_put_output"],
         unitconv=unitconv,
     )
 
@@ -881,9 +1299,11 @@ def _get_MIMO_SP_pdev_action_specs(
         out_reprs = RB_ch_def["HiLv_reprs"]
 
         conv_spec_name = RB_ch_pvs["get"].get("conv_spec_name", None)
-        unitconv = get_unitconv(elem_def, in_reprs, out_reprs, conv_spec_name)
+        unitconv = get_unitconv(
+            elem_def, in_reprs, out_reprs, conv_spec_name, spec_caches
+        )
 
-        specs["readback_in_set"] = PamilaDeviceActionSpec(
+        specs["readback_in_set"] = PamilaDeviceActionSpec.model_construct(
             input_cpt_attr_names=["RB_LoLv"],
             output_cpt_attr_names=["RB"],
             unitconv=unitconv,
@@ -903,12 +1323,19 @@ def get_MIMO_SP_pdev_spec(
     simulator_interface_path,
     mode_pdev_def,
     control_system: Literal["epics", "tango"],
+    spec_caches: Dict | None = None,
 ):
 
+    if spec_caches is None:
+        spec_caches = _new_spec_caches()
+
     pdev_name, psig_name_prefix = create_pdev_psig_names(mlv_name, machine_mode)
 
-    components = _get_MIMO_SP_components(
+    ext_or_int = get_ext_or_int(machine_mode)
+
+    components, key_buckets = _get_MIMO_SP_components(
         machine_mode,
+        ext_or_int,
         psig_name_prefix,
         elem_def,
         ch_def,
@@ -917,26 +1344,16 @@ def get_MIMO_SP_pdev_spec(
         simulator_interface_path,
         mode_pdev_def,
         control_system,
+        spec_caches,
     )
 
-    ext_or_int = get_ext_or_int(machine_mode)
     action_specs = _get_MIMO_SP_pdev_action_specs(
-        elem_def, ch_def, ext_or_int, list(components), mode_pdev_def
+        elem_def, ch_def, ext_or_int, key_buckets, mode_pdev_def, spec_caches
     )
 
-    fixed_wait_time_d = mode_pdev_def.get("fixed_wait_time", None)
-    if fixed_wait_time_d:
-        fixed_wait_time = FixedWaitTime(**fixed_wait_time_d)
-    else:
-        fixed_wait_time = None
-
-    SP_RB_diff_d = mode_pdev_def.get("SP_RB_diff", None)
-    if SP_RB_diff_d:
-        SP_RB_diff_d["RB_attr_name"] = "RB"
-        del SP_RB_diff_d["RB_channel"]
-        SP_RB_diff = SetpointReadbackDiff(**SP_RB_diff_d)
-    else:
-        SP_RB_diff = None
+    set_wait_spec, set_wait_method = _get_set_wait_spec_and_method(
+        mode_pdev_def, spec_caches
+    )
 
     simple_pdev_spec = SimplePamilaDeviceSpec(
         pdev_name=pdev_name,
@@ -947,16 +1364,42 @@ def get_MIMO_SP_pdev_spec(
         get_spec=action_specs["get"],
         put_spec=action_specs["put"],
         readback_in_set=action_specs.get("readback_in_set", None),
-        set_wait_spec=SetWaitSpec(
-            fixed_wait_time=fixed_wait_time, SP_RB_diff=SP_RB_diff
-        ),
-        set_wait_method=mode_pdev_def.get("set_wait_method", "fixed_wait_time"),
+        set_wait_spec=set_wait_spec,
+        set_wait_method=set_wait_method,
     )
 
     return simple_pdev_spec
 
 
+# pdev spec builders for each "type" of read-only (RB) & setpoint (SP) MLVs
+_RB_PDEV_SPEC_BUILDERS = {
+    "standard_RB": get_standard_RB_pdev_spec,
+    "standard_MIMO_RB": get_MIMO_RB_pdev_spec,
+}
+_SP_PDEV_SPEC_BUILDERS = {
+    "standard_SP": get_standard_SP_pdev_spec,
+    "standard_MIMO_SP": get_MIMO_SP_pdev_spec,
+}
+
+
+# Simulator interface spec class for each "package_name" in "sim_configs.yaml"
+_SIM_INTERFACE_SPEC_CLASSES = {"pyat": PyATInterfaceSpec}
+
+
+def _get_sim_interface_spec_class(sim_config_d: Dict):
+    spec_class = _SIM_INTERFACE_SPEC_CLASSES.get(sim_config_d["package_name"], None)
+    if spec_class is None:
+        raise NotImplementedError
+
+    return spec_class
+
+
 class MachineConfig:
+    # Version of the pickled state (see `_update_from_cache`)
+    # 2: `elem_name_pvid_to_pvinfo[ext_or_int][elem_name][pvid]` (previously
+    #    `elem_name_pvid_to_pvinfo[ext_or_int][(elem_name, pvid)]`)
+    _STATE_VERSION = 2
+
     def __init__(self, machine_name: str, dirpath: Path, model_name: str = ""):
 
         self.machine_name = machine_name
@@ -970,22 +1413,19 @@ class MachineConfig:
 
     def _noncache_load(self):
 
+        self._state_version = self._STATE_VERSION
+
         machine_folder = self.dirpath / self.machine_name
 
-        sim_configs_yaml_d = yaml.safe_load(
-            (machine_folder / "sim_configs.yaml").read_text()
-        )
-        sim_configs_d = sim_configs_yaml_d["simulator_configs"]
-        for k, v in sim_configs_d.items():
-            if v is None:
-                continue
-            match v["package_name"]:
-                case "pyat":
-                    sim_configs_d[k] = PyATInterfaceSpec(**v)
-                case _:
-                    raise NotImplementedError
+        sim_configs_yaml_d = _load_yaml_file(machine_folder / "sim_configs.yaml")
+        sim_configs_d = {
+            k: (None if v is None else _get_sim_interface_spec_class(v)(**v))
+            for k, v in sim_configs_yaml_d["simulator_configs"].items()
+        }
 
-        self.sim_configs = SimConfigs(**sim_configs_yaml_d)
+        self.sim_configs = SimConfigs(
+            **{**sim_configs_yaml_d, "simulator_configs": sim_configs_d}
+        )
         self.sel_config_name = self.sim_configs.selected_config
         self.sim_conf = self.sim_configs.simulator_configs[self.sel_config_name]
 
@@ -1012,6 +1452,13 @@ class MachineConfig:
 
     def _update_from_cache(self):
 
+        if getattr(self, "_state_version", 1) < 2:
+            # Rebuild the maps saved in the old layout
+            self.elem_name_pvid_to_pvinfo = {"ext": {}, "int": {}}
+            self._update_elem_name_pvid_to_pvinfo_ext()
+            self._update_elem_name_pvid_to_pvinfo_int()
+        self._state_version = self._STATE_VERSION
+
         self._load_device_conversion_plugins()
 
         self._set_sim_interface_spec()
@@ -1021,6 +1468,10 @@ class MachineConfig:
 
     def __getstate__(self):
 
+        if not self._non_serializable_attrs:
+            # Nothing to exclude; let pickle use the instance dict as is.
+            return self.__dict__
+
         state = self.__dict__.copy()
 
         # Exclude the non-serializable attributes
@@ -1041,31 +1492,29 @@ class MachineConfig:
             load_plugins(Path(self.sim_conf.conversion_plugin_folder))
 
     def _load_definitions_from_files(self):
-        self.sim_pv_defs = json.loads((self.config_folder / "sim_pvs.json").read_text())
 
-        self.simpv_elem_maps = json.loads(
-            (self.config_folder / "simpv_elem_maps.json").read_text()
-        )
+        folder = self.config_folder
 
-        self.pv_elem_maps = json.loads(
-            (self.config_folder / "pv_elem_maps.json").read_text()
-        )
+        defs = _load_definitions_bundle(folder)
 
-        self.elem_defs = json.loads((self.config_folder / "elements.json").read_text())
+        if defs is None:
+            defs = {
+                key: (
+                    _load_optional_yaml_file(folder / filename)
+                    if filename.endswith(".yaml")
+                    else _load_json_file(folder / filename)
+                )
+                for key, filename in _DEFINITION_FILES.items()
+            }
 
-        fp = self.config_folder / "mlvls.yaml"
-        if fp.exists():
-            self.mlvl_defs = yaml.safe_load(fp.read_text())
-        else:
-            self.mlvl_defs = None
+        self.sim_pv_defs = defs["sim_pvs"]
+        self.simpv_elem_maps = defs["simpv_elem_maps"]
+        self.pv_elem_maps = defs["pv_elem_maps"]
+        self.elem_defs = defs["elements"]
+        self.mlvl_defs = defs["mlvls"]
+        self.mlvt_defs = defs["mlvts"]
 
-        fp = self.config_folder / "mlvts.yaml"
-        if fp.exists():
-            self.mlvt_defs = yaml.safe_load(fp.read_text())
-        else:
-            self.mlvt_defs = None
-
-        self.elem_name_pvid_to_pvinfo = dict(ext={}, int={})
+        self.elem_name_pvid_to_pvinfo = {"ext": {}, "int": {}}
 
         self._update_elem_name_pvid_to_pvinfo_ext()
         self._update_elem_name_pvid_to_pvinfo_int()
@@ -1076,15 +1525,22 @@ class MachineConfig:
         elem_name_pvid_to_pvinfo = self.elem_name_pvid_to_pvinfo["ext"]
         elem_name_pvid_to_pvinfo.clear()
 
+        # Duplicate (elem_name, pvid) pairs are checked once afterwards
         for pvname, d in pv_elem_maps.items():
+            pvid = sys.intern(d["pvid_in_elem"])
+            # The (read-only) info is shared by all the elements using this PV.
+            pvinfo = {
+                "handle": d["handle"],
+                "pvname": {"LIVE": pvname, "DT": d.get("DT_pvname", None)},
+                "pvunit": {"LIVE": d["pvunit"], "DT": d.get("DT_pvunit", None)},
+            }
             for elem_name in d["elem_names"]:
-                k = (elem_name, d["pvid_in_elem"])
-                assert k not in elem_name_pvid_to_pvinfo
-                elem_name_pvid_to_pvinfo[k] = {
-                    "handle": d["handle"],
-                    "pvname": dict(LIVE=pvname, DT=d.get("DT_pvname", None)),
-                    "pvunit": dict(LIVE=d["pvunit"], DT=d.get("DT_pvunit", None)),
-                }
+                pvid_to_pvinfo = elem_name_pvid_to_pvinfo.setdefault(
+                    sys.intern(elem_name), {}
+                )
+                pvid_to_pvinfo[pvid] = pvinfo
+
+        _check_elem_name_pvid_uniqueness(elem_name_pvid_to_pvinfo, pv_elem_maps)
 
     def _update_elem_name_pvid_to_pvinfo_int(self):
 
@@ -1093,22 +1549,28 @@ class MachineConfig:
         elem_name_pvid_to_pvinfo.clear()
 
         for pvsuffix, d in simpv_elem_maps.items():
-
+            pvid = sys.intern(d["pvid_in_elem"])
+            pvinfo = {
+                "handle": d["handle"],
+                "pvsuffix": pvsuffix,
+                "pvunit": d["pvunit"],
+            }
             for elem_name in d["elem_names"]:
-                k = (elem_name, d["pvid_in_elem"])
-                assert k not in elem_name_pvid_to_pvinfo
-                elem_name_pvid_to_pvinfo[k] = {
-                    "handle": d["handle"],
-                    "pvsuffix": pvsuffix,
-                    "pvunit": d["pvunit"],
-                }
+                pvid_to_pvinfo = elem_name_pvid_to_pvinfo.setdefault(
+                    sys.intern(elem_name), {}
+                )
+                pvid_to_pvinfo[pvid] = pvinfo
+
+        _check_elem_name_pvid_uniqueness(elem_name_pvid_to_pvinfo, simpv_elem_maps)
 
     def _load_lattice_design_props_from_files(self):
 
-        d = self.design_lat_props = {}
-        for model_name in self.sim_conf.lattice_models.keys():
-            folder = self.config_folder / model_name
-            d[model_name] = json.loads((folder / "design_props.json").read_text())
+        self.design_lat_props = {
+            model_name: _load_json_file(
+                self.config_folder / model_name / "design_props.json"
+            )
+            for model_name in self.sim_conf.lattice_models
+        }
 
     def get_design_lattice_props(self):
         return self.design_lat_props[self._lattice_model_name]
@@ -1117,10 +1579,10 @@ class MachineConfig:
 
         match self.sim_conf.package_name:
             case "pyat":
-                sim_pv_defs = {}
-                for pvsuffix, d in self.sim_pv_defs["sim_pv_definitions"].items():
-                    assert pvsuffix not in sim_pv_defs
-                    sim_pv_defs[pvsuffix] = SimulatorPvDefinition(**d)
+                sim_pv_defs = {
+                    pvsuffix: SimulatorPvDefinition(**d)
+                    for pvsuffix, d in self.sim_pv_defs["sim_pv_definitions"].items()
+                }
                 sim_conf_d = self.sim_conf.model_dump()
                 sim_conf_d["sim_pv_defs"] = sim_pv_defs
                 self.sim_itf_spec = PyATInterfaceSpec(**sim_conf_d)
@@ -1131,26 +1593,16 @@ class MachineConfig:
 
         set_sim_interface_spec(self.machine_name, self.sim_itf_spec)
 
-        self.sim_itf_paths = {}
-
     def _add_sim_pv_def(self, new_entry: Dict):
         d = new_entry
         pvsuffix = d["pvsuffix"]
         sim_itf = self.get_sim_interface()
-        sim_itf._sim_pv_defs[pvsuffix] = SimulatorPvDefinition(
-            **{k: v for k, v in d.items() if k != "pvsuffix"}
-        )
+        # "pvsuffix" is not a field of SimulatorPvDefinition and is ignored
+        # during validation, so no filtered copy of `d` is needed.
+        sim_itf._sim_pv_defs[pvsuffix] = SimulatorPvDefinition.model_validate(d)
 
     def _get_sim_interface_path(self, machine_mode: MachineMode):
-
-        itf_path = self.sim_itf_paths.get(machine_mode, None)
-        if itf_path is None:
-            itf_path = SimulatorInterfacePath(
-                machine_name=self.machine_name, machine_mode=machine_mode
-            )
-            self.sim_itf_paths[machine_mode] = itf_path
-
-        return itf_path
+        return _get_sim_interface_path(self.machine_name, machine_mode)
 
     def get_sim_interface(self):
 
@@ -1160,16 +1612,43 @@ class MachineConfig:
 
         return get_sim_interface(itf_path)
 
+    def _get_sim_interface_paths(self):
+
+        return {
+            machine_mode: self._get_sim_interface_path(machine_mode)
+            for machine_mode in MachineMode
+            if get_ext_or_int(machine_mode) == "int"
+        }
+
     def _construct_mlvs(self):
 
+        sim_itf_paths = self._get_sim_interface_paths()
+
+        # Only shared during this construction pass, and discarded afterwards
+        spec_caches = _new_spec_caches()
+
         for elem_name, e_def in self.elem_defs["elem_definitions"].items():
-            self._construct_mlvs_for_one_elem(elem_name, e_def, exist_ok=False)
+            self._construct_mlvs_for_one_elem(
+                elem_name,
+                e_def,
+                exist_ok=False,
+                sim_itf_paths=sim_itf_paths,
+                spec_caches=spec_caches,
+            )
 
     def _construct_mlvs_for_one_elem(
-        self, elem_name: str, elem_def: Dict, exist_ok: bool = False
+        self,
+        elem_name: str,
+        elem_def: Dict,
+        exist_ok: bool = False,
+        sim_itf_paths: Dict | None = None,
+        spec_caches: Dict | None = None,
     ):
 
-        elem_name_pvid_to_pvinfo = self.elem_name_pvid_to_pvinfo
+        if sim_itf_paths is None:
+            sim_itf_paths = self._get_sim_interface_paths()
+        if spec_caches is None:
+            spec_caches = _new_spec_caches()
 
         if "s_lists" in elem_def:
             elem_s_list = elem_def["s_lists"].get("element", None)
@@ -1215,100 +1694,22 @@ class MachineConfig:
 
             pdev_def = ch_def["pdev_def"]
 
-            pdev_specs = {}
-
-            for machine_mode_value, orig_mode_pdev_def in pdev_def.items():
-                machine_mode = MachineMode(machine_mode_value)
-
-                if get_ext_or_int(machine_mode) == "int":
-                    sim_itf_path = self._get_sim_interface_path(machine_mode)
-                else:
-                    sim_itf_path = None
-
-                mode_pdev_def = deepcopy(orig_mode_pdev_def)
-
-                if read_only:
-                    mode_pdev_def_type = mode_pdev_def.pop("type", "standard_RB")
-
-                    match mode_pdev_def_type:
-                        case "standard_RB":
-                            pdev_spec = get_standard_RB_pdev_spec(
-                                mlv_name,
-                                self.machine_name,
-                                machine_mode,
-                                elem_def,
-                                ch_def,
-                                elem_name_pvid_to_pvinfo,
-                                elem_name,
-                                sim_itf_path,
-                                self.sim_configs.control_system,
-                            )
-                        case "plugin":
-                            raise NotImplementedError
-                        case "standard_MIMO_RB":
-                            pdev_spec = get_MIMO_RB_pdev_spec(
-                                mlv_name,
-                                self.machine_name,
-                                machine_mode,
-                                elem_def,
-                                ch_def,
-                                elem_name_pvid_to_pvinfo,
-                                elem_name,
-                                sim_itf_path,
-                                self.sim_configs.control_system,
-                            )
-
-                        case _:
-                            raise NotImplementedError
-
-                else:
-                    mode_pdev_def_type = mode_pdev_def.get("type", "standard_SP")
-
-                    match mode_pdev_def_type:
-
-                        case "standard_SP":
-                            _mode_pdev_def = json.loads(
-                                StandardSetpointDeviceDefinition(
-                                    **mode_pdev_def
-                                ).model_dump_json()
-                            )
-                            _mode_pdev_def.pop("type")
-                            pdev_spec = get_standard_SP_pdev_spec(
-                                mlv_name,
-                                self.machine_name,
-                                machine_mode,
-                                elem_def,
-                                ch_def,
-                                elem_name_pvid_to_pvinfo,
-                                elem_name,
-                                sim_itf_path,
-                                _mode_pdev_def,
-                                self.sim_configs.control_system,
-                            )
-                        case "standard_MIMO_SP":
-                            _mode_pdev_def = json.loads(
-                                StandardSetpointDeviceDefinition(
-                                    **mode_pdev_def
-                                ).model_dump_json()
-                            )
-                            _mode_pdev_def.pop("type")
-                            pdev_spec = get_MIMO_SP_pdev_spec(
-                                mlv_name,
-                                self.machine_name,
-                                machine_mode,
-                                elem_def,
-                                ch_def,
-                                elem_name_pvid_to_pvinfo,
-                                elem_name,
-                                sim_itf_path,
-                                _mode_pdev_def,
-                                self.sim_configs.control_system,
-                            )
-
-                        case _:
-                            raise NotImplementedError
-
-                pdev_specs[machine_mode] = pdev_spec
+            pdev_specs = {
+                machine_mode: self._build_pdev_spec_for_mode(
+                    machine_mode,
+                    mode_pdev_def,
+                    read_only,
+                    mlv_name,
+                    elem_name,
+                    elem_def,
+                    ch_def,
+                    sim_itf_paths,
+                    spec_caches,
+                )
+                for machine_mode, mode_pdev_def in (
+                    (MachineMode(k), v) for k, v in pdev_def.items()
+                )
+            }
 
             mlv_spec = MiddleLayerVariableSpec(
                 name=mlv_name,
@@ -1320,3 +1721,61 @@ class MachineConfig:
                 tags=KeyValueTagList(tags=tags_d),
             )
             mlv_class(mlv_spec)
+
+    def _build_pdev_spec_for_mode(
+        self,
+        machine_mode: MachineMode,
+        mode_pdev_def: Dict,
+        read_only: bool,
+        mlv_name: str,
+        elem_name: str,
+        elem_def: Dict,
+        ch_def: Dict,
+        sim_itf_paths: Dict,
+        spec_caches: Dict,
+    ):
+
+        sim_itf_path = sim_itf_paths.get(machine_mode, None)
+
+        if read_only:
+            mode_pdev_def_type = mode_pdev_def.get("type", "standard_RB")
+            builder = _RB_PDEV_SPEC_BUILDERS.get(mode_pdev_def_type, None)
+            if builder is None:  # including "plugin"
+                raise NotImplementedError
+
+            return builder(
+                mlv_name,
+                self.machine_name,
+                machine_mode,
+                elem_def,
+                ch_def,
+                self.elem_name_pvid_to_pvinfo,
+                elem_name,
+                sim_itf_path,
+                self.sim_configs.control_system,
+                spec_caches=spec_caches,
+            )
+
+        else:
+            mode_pdev_def_type = mode_pdev_def.get("type", "standard_SP")
+            builder = _SP_PDEV_SPEC_BUILDERS.get(mode_pdev_def_type, None)
+            if builder is None:
+                raise NotImplementedError
+
+            # JSON-compatible dict with the defaults filled in
+            _mode_pdev_def = StandardSetpointDeviceDefinition(
+                **mode_pdev_def
+            ).model_dump(mode="json", exclude={"type"})
+            return builder(
+                mlv_name,
+                self.machine_name,
+                machine_mode,
+                elem_def,
+                ch_def,
+                self.elem_name_pvid_to_pvinfo,
+                elem_name,
+                sim_itf_path,
+                _mode_pdev_def,
+                self.sim_configs.control_system,
+                spec_caches=spec_caches,
+            )
@@ -19,7 +19,7 @@ from ..serialization import json_deserialize_pint_quantity, json_serialize_pint_
 from ..unit import Q_
 from ..utils import ChainedPropertyFetcher, ChainedPropertyPusher
 from ..utils import KeyIndexAccess as KIA
-from ..utils import MachineDefault, RevalidatingModel, StatisticsType
+from ..utils import MachineDefault, RevalidatingModel, StatisticsType, yaml_load
 
 HLA_DEFAULTS = {}
 
@@ -34,7 +34,7 @@ def load_hla_defaults(yaml_filepath: str | Path | None = None):
     if not yaml_filepath.exists():
         raise FileNotFoundError()
 
-    d = yaml.safe_load(yaml_filepath.read_text())["machines"]
+    d = yaml_load(yaml_filepath)["machines"]
 
     HLA_DEFAULTS.clear()
     HLA_DEFAULTS.update(nested_deserialize_mlo_names(d))
@@ -1,8 +1,25 @@
 from enum import Enum
+from pathlib import Path
 from typing import Any, Dict, List, Literal
 
 import numpy as np
 from pydantic import BaseModel, Field, field_validator, model_serializer
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlSafeLoader
+
+
+def yaml_load(fp: Path | str):
+    # Safe loading, with the (much faster) libyaml-based loader if available
+    with open(fp, "rb") as f:
+        return yaml.load(f, Loader=_YamlSafeLoader)
+
+
+def yaml_loads(content: bytes | str):
+    return yaml.load(content, Loader=_YamlSafeLoader)
 
 
 class RevalidatingModel(BaseModel):
@@ -0,0 +1,169 @@
+from collections import OrderedDict
+import json
+import math
+import os
+
+import pytest
+
+from pamila.facility_configs import loader
+
+
+@pytest.fixture
+def config_folder(tmp_path):
+    files = {
+        "sim_pvs.json": {"sim_pv_definitions": {}},
+        "simpv_elem_maps.json": {"simpv_elem_maps": {}},
+        "pv_elem_maps.json": {"pv_elem_maps": {}},
+        "elements.json": {"elem_definitions": {"Q1": {"repr_units": {"I": "A"}}}},
+    }
+    for filename, d in files.items():
+        (tmp_path / filename).write_text(json.dumps(d))
+    (tmp_path / "mlvls.yaml").write_text("mlvl_definitions:\n  quads: [Q1_I]\n")
+
+    return tmp_path
+
+
+def test_bundle_round_trip(config_folder):
+    bundle_fp = loader.write_definitions_bundle(config_folder)
+    assert bundle_fp == config_folder / "definitions.bundle.json"
+
+    defs = loader._load_definitions_bundle(config_folder)
+    assert defs["elements"] == json.loads((config_folder / "elements.json").read_text())
+    assert defs["mlvls"] == {"mlvl_definitions": {"quads": ["Q1_I"]}}
+    assert defs["mlvts"] is None
+
+
+def test_bundle_missing_or_corrupt(config_folder):
+    assert loader._load_definitions_bundle(config_folder) is None
+
+    (config_folder / "definitions.bundle.json").write_text("{")
+    assert loader._load_definitions_bundle(config_folder) is None
+
+
+def test_bundle_keeps_nan(config_folder):
+    (config_folder / "elements.json").write_text('{"elem_definitions": {"x": NaN}}')
+
+    loader.write_definitions_bundle(config_folder)
+
+    defs = loader._load_definitions_bundle(config_folder)
+    assert math.isnan(defs["elements"]["elem_definitions"]["x"])
+
+
+def test_bundle_rejects_non_str_keys(config_folder):
+    (config_folder / "mlvls.yaml").write_text("mlvl_definitions:\n  1: [Q1_I]\n")
+
+    with pytest.raises(ValueError, match="non-string"):
+        loader.write_definitions_bundle(config_folder)
+
+
+def test_bundle_stale_after_same_size_edit(config_folder):
+    loader.write_definitions_bundle(config_folder)
+
+    fp = config_folder / "mlvls.yaml"
+    stat = fp.stat()
+    fp.write_text(fp.read_text().replace("Q1_I", "Q2_I"))
+    os.utime(fp, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert fp.stat().st_size == stat.st_size
+
+    assert loader._load_definitions_bundle(config_folder) is None
+
+
+def test_bundle_stale_after_optional_file_removed(config_folder):
+    loader.write_definitions_bundle(config_folder)
+
+    (config_folder / "mlvls.yaml").unlink()
+
+    assert loader._load_definitions_bundle(config_folder) is None
+
+
+def test_bundle_stale_after_optional_file_added(config_folder):
+    loader.write_definitions_bundle(config_folder)
+
+    (config_folder / "mlvts.yaml").write_text("mlvt_definitions: {}\n")
+
+    assert loader._load_definitions_bundle(config_folder) is None
+
+
+def test_bundle_stale_after_required_file_removed(config_folder):
+    loader.write_definitions_bundle(config_folder)
+
+    (config_folder / "sim_pvs.json").unlink()
+
+    assert loader._load_definitions_bundle(config_folder) is None
+
+
+@pytest.fixture
+def yaml_cache_folder(tmp_path, monkeypatch):
+    folder = tmp_path / "yaml_cache"
+    monkeypatch.setattr(loader, "_YAML_CACHE_FOLDER", folder)
+    monkeypatch.setattr(loader, "_PARSED_YAML", OrderedDict())
+    return folder
+
+
+def test_yaml_disk_cache_is_used(tmp_path, yaml_cache_folder):
+    fp = tmp_path / "a.yaml"
+    fp.write_text("x: 1\n")
+
+    assert loader._load_yaml_file(fp) == {"x": 1}
+    (cache_fp,) = yaml_cache_folder.iterdir()
+
+    # Served from the disk cache once the in-memory cache is empty
+    cached = json.loads(cache_fp.read_text())
+    cached["data"] = {"x": "from cache"}
+    cache_fp.write_text(json.dumps(cached))
+    loader._PARSED_YAML.clear()
+    assert loader._load_yaml_file(fp) == {"x": "from cache"}
+
+
+def test_yaml_disk_cache_keeps_one_entry_per_file(tmp_path, yaml_cache_folder):
+    fp = tmp_path / "a.yaml"
+    for i in range(3):
+        fp.write_text(f"x: {i}\n")
+        assert loader._load_yaml_file(fp) == {"x": i}
+
+    assert len(list(yaml_cache_folder.iterdir())) == 1
+
+
+def test_yaml_disk_cache_skips_non_str_keys(tmp_path, yaml_cache_folder):
+    fp = tmp_path / "a.yaml"
+    fp.write_text("1: a\n")
+
+    assert loader._load_yaml_file(fp) == {1: "a"}
+    assert not yaml_cache_folder.exists() or not list(yaml_cache_folder.iterdir())
+
+
+def test_yaml_disk_cache_keeps_nan(tmp_path, yaml_cache_folder):
+    fp = tmp_path / "a.yaml"
+    fp.write_text("x: .nan\n")
+
+    loader._load_yaml_file(fp)
+    loader._PARSED_YAML.clear()
+
+    assert math.isnan(loader._load_yaml_file(fp)["x"])
+    assert len(list(yaml_cache_folder.iterdir())) == 1
+
+
+def test_parsed_yaml_returns_copies(tmp_path, yaml_cache_folder):
+    fp = tmp_path / "a.yaml"
+    fp.write_text("x: [1, 2]\n")
+
+    d1 = loader._load_yaml_file(fp)
+    d1["x"].append(3)
+
+    assert loader._load_yaml_file(fp) == {"x": [1, 2]}
+
+
+def test_parsed_yaml_lru(tmp_path, yaml_cache_folder, monkeypatch):
+    monkeypatch.setattr(loader, "_MAX_N_PARSED_YAML", 2)
+
+    fps = {}
+    for name in ["a", "b", "c"]:
+        fps[name] = tmp_path / f"{name}.yaml"
+        fps[name].write_text(f"name: {name}\n")
+
+    loader._load_yaml_file(fps["a"])
+    loader._load_yaml_file(fps["b"])
+    loader._load_yaml_file(fps["a"])  # "b" is now the least recently used
+    loader._load_yaml_file(fps["c"])
+
+    assert [d["name"] for d in loader._PARSED_YAML.values()] == ["a", "c"]